@@ -6,6 +6,7 @@ Provides: Message search, media gallery, social graph, RSS feeds.
 """
 
 import os
+import re
 import time
 import uuid
 
@@ -80,6 +81,14 @@ REQUEST_DURATION = Histogram(
     ['method', 'endpoint']
 )
 
+# Label children resolved once per (method, endpoint[, status]) so the
+# per-request middleware skips labels() on repeat routes
+_request_count_children: dict = {}
+_request_duration_children: dict = {}
+
+# Numeric path segments collapsed to {id} for the endpoint label
+_NUMERIC_SEGMENT = re.compile(r'/\d+')
+
 # API description
 API_DESCRIPTION = """
 REST API for tg-archiver - Self-hosted Telegram channel archiver.
@@ -219,14 +228,27 @@ async def metrics_middleware(request: Request, call_next):
     if request.url.path in ["/metrics", "/health"]:
         return await call_next(request)
 
-    import re
-    endpoint = re.sub(r'/\d+', '/{id}', request.url.path)
+    endpoint = _NUMERIC_SEGMENT.sub('/{id}', request.url.path)
     start_time = time.time()
     response = await call_next(request)
     duration = time.time() - start_time
 
-    REQUEST_COUNT.labels(method=request.method, endpoint=endpoint, status=str(response.status_code)).inc()
-    REQUEST_DURATION.labels(method=request.method, endpoint=endpoint).observe(duration)
+    method = request.method
+    key = (method, endpoint)
+    duration_child = _request_duration_children.get(key)
+    if duration_child is None:
+        duration_child = _request_duration_children[key] = REQUEST_DURATION.labels(
+            method=method, endpoint=endpoint
+        )
+    duration_child.observe(duration)
+
+    count_key = (method, endpoint, response.status_code)
+    count_child = _request_count_children.get(count_key)
+    if count_child is None:
+        count_child = _request_count_children[count_key] = REQUEST_COUNT.labels(
+            method=method, endpoint=endpoint, status=str(response.status_code)
+        )
+    count_child.inc()
     return response
 
 
@@ -40,6 +40,29 @@ from ...utils.sql_safety import escape_ilike_pattern
 
 logger = logging.getLogger(__name__)
 
+# MinIO client for export downloads, created on first download and reused
+_export_minio_client = None
+
+
+def _get_export_minio_client():
+    """Return the cached MinIO client used to stream export files."""
+    global _export_minio_client
+
+    if _export_minio_client is None:
+        from minio import Minio
+        from config.settings import settings
+
+        # Use internal endpoint for container-to-container communication
+        _export_minio_client = Minio(
+            settings.MINIO_ENDPOINT.replace("http://", "").replace("https://", ""),
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=settings.MINIO_ENDPOINT.startswith("https://"),
+        )
+
+    return _export_minio_client
+
+
 router = APIRouter(prefix="/api/admin/export", tags=["Admin - Export"])
 
 
@@ -575,7 +598,6 @@ async def download_export(
     # Stream file from MinIO through the API
     # This avoids Docker networking issues with presigned URLs
     try:
-        from minio import Minio
         from config.settings import settings
 
         if not settings.MINIO_ENDPOINT:
@@ -584,13 +606,7 @@ async def download_export(
                 detail="MinIO not configured",
             )
 
-        # Use internal endpoint for container-to-container communication
-        minio_client = Minio(
-            settings.MINIO_ENDPOINT.replace("http://", "").replace("https://", ""),
-            access_key=settings.MINIO_ACCESS_KEY,
-            secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_ENDPOINT.startswith("https://"),
-        )
+        minio_client = _get_export_minio_client()
 
         # Get the object from MinIO
         response = minio_client.get_object(
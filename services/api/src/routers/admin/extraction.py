@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import get_db
 from ...dependencies import AdminUser
+from ...utils.cache import get_redis_client
 
 router = APIRouter(prefix="/api/admin/extraction", tags=["admin-extraction"])
 
@@ -469,16 +470,11 @@ async def reload_patterns(
     """
     Trigger pattern reload on processor service.
     Publishes a message to Redis pub/sub that the processor listens to.
+    Reuses the API's pooled Redis client rather than connecting per request.
     """
-    import redis.asyncio as redis
-    import os
-
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-
     try:
-        r = redis.from_url(redis_url)
+        r = await get_redis_client()
         await r.publish("extraction:reload", "reload")
-        await r.close()
         return {"success": True, "message": "Reload signal sent to processor"}
     except Exception as e:
         logger.error(f"Failed to send reload signal: {e}")
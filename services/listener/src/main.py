@@ -292,6 +292,11 @@ async def main() -> NoReturn:
     """
     logger.info("Starting Telegram Listener Service v0.1.0")
 
+    # Route SIGTERM/SIGINT through the event loop so shutdown_event wakes it immediately
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, handle_shutdown, sig, None)
+
     # Initialize components
     telegram_client = None
     listener = None
@@ -542,7 +547,7 @@ def handle_shutdown(signum: int, frame) -> None:
     Signal Flow
     -----------
     1. User presses Ctrl+C or Docker sends SIGTERM
-    2. OS invokes this handler with signal number
+    2. Event loop wakes via its signal wakeup fd and invokes this handler
     3. Handler logs signal receipt and sets shutdown_event
     4. main() function wakes from shutdown_event.wait()
     5. main() enters finally block for cleanup
@@ -554,8 +559,8 @@ def handle_shutdown(signum: int, frame) -> None:
         Signal number received (signal.SIGINT=2, signal.SIGTERM=15).
 
     frame : frame object
-        Current stack frame at time of signal. Not used but required by
-        signal.signal() API.
+        Current stack frame at time of signal. Not used; the event loop passes
+        None (kept for the signal.signal() handler signature).
 
     Notes
     -----
@@ -579,10 +584,6 @@ if __name__ == "__main__":
     # Note: Structured logging already configured at module import via setup_logging()
     # No need for logging.basicConfig() - the observability module handles it
 
-    # Setup signal handlers
-    signal.signal(signal.SIGTERM, handle_shutdown)
-    signal.signal(signal.SIGINT, handle_shutdown)
-
     # Run the service
     try:
         asyncio.run(main())
@@ -23,12 +23,12 @@ Legacy:
 - "telegram:messages" stream is deprecated and only drained by processor
 """
 
-import json
 import logging
 import uuid
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio.client import Redis
 from redis.exceptions import RedisError
@@ -198,9 +198,9 @@ class RedisQueue:
         # Add any extra fields
         for key, value in extra_fields.items():
             if value is not None:
-                # Convert complex types to JSON
+                # Convert complex types to JSON (orjson; stdlib-compatible output)
                 if isinstance(value, (dict, list)):
-                    fields[key] = json.dumps(value)
+                    fields[key] = orjson.dumps(value).decode("utf-8")
                 else:
                     fields[key] = str(value)
 
@@ -217,9 +217,9 @@ class RedisQueue:
             )
 
             logger.debug(
-                f"Pushed message to queue: stream={stream_name}, stream_id={stream_id}, "
-                f"message_id={message_id}, channel_id={channel_id}, "
-                f"has_media={bool(media_type)}, trace_id={trace_id}"
+                "Pushed message to queue: stream=%s, stream_id=%s, "
+                "message_id=%s, channel_id=%s, has_media=%s, trace_id=%s",
+                stream_name, stream_id, message_id, channel_id, bool(media_type), trace_id,
             )
 
             return stream_id
@@ -347,7 +347,7 @@ class TelegramListener:
             # Mark this grouped_id as processed by Album event
             # This prevents the fallback mechanism from double-processing
             if grouped_id in self.grouped_messages_cache:
-                logger.debug(f"Album event received for {grouped_id}, clearing fallback buffer")
+                logger.debug("Album event received for %s, clearing fallback buffer", grouped_id)
                 self.grouped_messages_cache.pop(grouped_id, None)
 
             # Use Telethon's built-in text extraction (finds caption from any message)
@@ -366,9 +366,8 @@ class TelegramListener:
             telegram_date = primary_msg.date
 
             logger.info(
-                f"Album received via events.Album: channel={channel.name}, "
-                f"grouped_id={grouped_id}, items={len(messages)}, "
-                f"has_caption={content is not None and len(content) > 0}"
+                "Album received via events.Album: channel=%s, grouped_id=%s, items=%d, has_caption=%s",
+                channel.name, grouped_id, len(messages), content is not None and len(content) > 0,
             )
 
             # Detect media type from first message with media
@@ -426,9 +425,8 @@ class TelegramListener:
             record_message_queued(channel_id=channel.telegram_id)
 
             logger.info(
-                f"Queued album: channel={channel.name}, "
-                f"message_id={primary_msg.id}, media_count={len(messages)}, "
-                f"has_caption={content is not None and len(content) > 0}"
+                "Queued album: channel=%s, message_id=%s, media_count=%d, has_caption=%s",
+                channel.name, primary_msg.id, len(messages), content is not None and len(content) > 0,
             )
 
         except FloodWaitError as e:
@@ -519,8 +517,8 @@ class TelegramListener:
 
         # Debug log - Album event should normally handle this
         logger.debug(
-            f"Fallback buffer: msg_id={message.id}, group={grouped_id}, "
-            f"buffered={len(group['messages'])}, channel={channel.name}"
+            "Fallback buffer: msg_id=%s, group=%s, buffered=%d, channel=%s",
+            message.id, grouped_id, len(group['messages']), channel.name,
         )
 
     async def _fetch_complete_album_from_telegram(
@@ -591,7 +589,7 @@ class TelegramListener:
         # Early return if group not in cache (prevents KeyError in finally block)
         # This can happen if flush is called twice for same group (race condition)
         if grouped_id not in self.grouped_messages_cache:
-            logger.debug(f"Grouped message {grouped_id} not in cache, already flushed")
+            logger.debug("Grouped message %s not in cache, already flushed", grouped_id)
             return
 
         group = self.grouped_messages_cache[grouped_id]
@@ -612,9 +610,9 @@ class TelegramListener:
 
             if is_incomplete:
                 logger.info(
-                    f"Album appears incomplete: grouped_id={grouped_id}, "
-                    f"buffered={len(messages)}, has_caption={has_caption}. "
-                    f"Fetching complete album from Telegram..."
+                    "Album appears incomplete: grouped_id=%s, buffered=%d, has_caption=%s. "
+                    "Fetching complete album from Telegram...",
+                    grouped_id, len(messages), has_caption,
                 )
 
                 # Actively fetch the complete album from Telegram
@@ -626,8 +624,8 @@ class TelegramListener:
 
                 if fetched_messages and len(fetched_messages) > len(messages):
                     logger.info(
-                        f"Fetched complete album: grouped_id={grouped_id}, "
-                        f"buffered={len(messages)} → fetched={len(fetched_messages)}"
+                        "Fetched complete album: grouped_id=%s, buffered=%d → fetched=%d",
+                        grouped_id, len(messages), len(fetched_messages),
                     )
                     # Use fetched messages instead of buffered ones
                     messages = fetched_messages
@@ -635,8 +633,8 @@ class TelegramListener:
                     first_msg = messages[0]
                 elif fetched_messages:
                     logger.debug(
-                        f"Fetch didn't find more messages: grouped_id={grouped_id}, "
-                        f"buffered={len(messages)}, fetched={len(fetched_messages)}"
+                        "Fetch didn't find more messages: grouped_id=%s, buffered=%d, fetched=%d",
+                        grouped_id, len(messages), len(fetched_messages),
                     )
                 else:
                     logger.warning(
@@ -690,10 +688,11 @@ class TelegramListener:
             )
 
             logger.debug(
-                f"Flushing grouped message: channel={channel.name}, "
-                f"message_id={primary_msg.id}, media_count={len(messages)}, "
-                f"author={social_metadata.get('author_user_id')}, "
-                f"forwarded={bool(social_metadata.get('forward_from_channel_id'))}"
+                "Flushing grouped message: channel=%s, message_id=%s, media_count=%d, "
+                "author=%s, forwarded=%s",
+                channel.name, primary_msg.id, len(messages),
+                social_metadata.get('author_user_id'),
+                bool(social_metadata.get('forward_from_channel_id')),
             )
 
             # Collect all message IDs in the group for media download
@@ -727,9 +726,8 @@ class TelegramListener:
             record_message_queued(channel_id=channel.telegram_id)
 
             logger.info(
-                f"Queued album (via fallback): channel={channel.name}, "
-                f"message_id={primary_msg.id}, media_count={len(messages)}, "
-                f"has_caption={content is not None}"
+                "Queued album (via fallback): channel=%s, message_id=%s, media_count=%d, has_caption=%s",
+                channel.name, primary_msg.id, len(messages), content is not None,
             )
 
         except Exception as e:
@@ -779,10 +777,10 @@ class TelegramListener:
         )
 
         logger.debug(
-            f"Received message: channel={channel.name}, "
-            f"message_id={message.id}, has_media={bool(media_type)}, "
-            f"author={social_metadata.get('author_user_id')}, "
-            f"forwarded={bool(social_metadata.get('forward_from_channel_id'))}"
+            "Received message: channel=%s, message_id=%s, has_media=%s, author=%s, forwarded=%s",
+            channel.name, message.id, bool(media_type),
+            social_metadata.get('author_user_id'),
+            bool(social_metadata.get('forward_from_channel_id')),
         )
 
         # Push to Redis queue with social graph metadata
@@ -809,9 +807,7 @@ class TelegramListener:
 
         record_message_queued(channel_id=channel.telegram_id)
 
-        logger.debug(
-            f"Queued message: channel={channel.name}, message_id={message.id}"
-        )
+        logger.debug("Queued message: channel=%s, message_id=%s", channel.name, message.id)
 
     async def _periodic_group_flush(self):
         """
@@ -871,7 +867,7 @@ class TelegramListener:
 
             # Flush stale groups
             for grouped_id in stale_groups:
-                logger.info(f"Auto-flushing stale grouped message {grouped_id}")
+                logger.info("Auto-flushing stale grouped message %s", grouped_id)
                 await self._flush_grouped_message(grouped_id)
 
         logger.info("Periodic group flush task stopped")
@@ -137,6 +137,11 @@ async def main() -> NoReturn:
     """Main entry point for the processor service."""
     logger.info("Starting Message Processor Service v1.0.0 (No AI - Archives Everything)")
 
+    # Route SIGTERM/SIGINT through the event loop so shutdown_event wakes it immediately
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, handle_shutdown, sig, None)
+
     # Start Prometheus metrics server on port 8002
     try:
         processor_metrics_server.start()
@@ -357,10 +362,6 @@ def handle_shutdown(signum: int, frame) -> None:
 
 
 if __name__ == "__main__":
-    # Setup signal handlers
-    signal.signal(signal.SIGTERM, handle_shutdown)
-    signal.signal(signal.SIGINT, handle_shutdown)
-
     # Run the service
     try:
         asyncio.run(main())
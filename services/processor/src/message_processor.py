@@ -148,24 +148,25 @@ class MessageProcessor:
 
         self.messages_processed += 1
 
-        # Log social graph metadata if present
-        social_graph_info = []
-        if message.author_user_id:
-            social_graph_info.append(f"author={message.author_user_id}")
-        if message.replied_to_message_id:
-            social_graph_info.append(f"reply_to={message.replied_to_message_id}")
-        if message.forward_from_channel_id:
-            social_graph_info.append(f"forward_from={message.forward_from_channel_id}")
-        if message.has_comments:
-            social_graph_info.append(f"comments={message.comments_count}")
-
-        social_graph_str = f" [{', '.join(social_graph_info)}]" if social_graph_info else ""
-
-        logger.info(
-            f"Processing message: stream_id={message.stream_id}, "
-            f"message_id={message.message_id}, channel_id={message.channel_id}, "
-            f"grouped_id={message.grouped_id}{social_graph_str}"
-        )
+        # Log social graph metadata if present (skip building it when INFO is filtered)
+        if logger.isEnabledFor(logging.INFO):
+            social_graph_info = []
+            if message.author_user_id:
+                social_graph_info.append(f"author={message.author_user_id}")
+            if message.replied_to_message_id:
+                social_graph_info.append(f"reply_to={message.replied_to_message_id}")
+            if message.forward_from_channel_id:
+                social_graph_info.append(f"forward_from={message.forward_from_channel_id}")
+            if message.has_comments:
+                social_graph_info.append(f"comments={message.comments_count}")
+
+            social_graph_str = f" [{', '.join(social_graph_info)}]" if social_graph_info else ""
+
+            logger.info(
+                "Processing message: stream_id=%s, message_id=%s, channel_id=%s, grouped_id=%s%s",
+                message.stream_id, message.message_id, message.channel_id,
+                message.grouped_id, social_graph_str,
+            )
 
         # Filter phantom messages (no content AND no media)
         has_content = message.content and message.content.strip()
@@ -219,7 +220,7 @@ class MessageProcessor:
                             duration_seconds=entity_extraction_duration,
                         )
 
-                logger.debug(f"Extracted {entity_count} entities")
+                logger.debug("Extracted %d entities", entity_count)
 
                 # Step 4: Translation (if enabled)
                 translated_content = None
@@ -240,7 +241,7 @@ class MessageProcessor:
                                 }
 
                                 logger.debug(
-                                    f"Translated message {message.message_id} via {method}"
+                                    "Translated message %s via %s", message.message_id, method
                                 )
 
                         except Exception as e:
@@ -255,7 +256,7 @@ class MessageProcessor:
                             if message.album_message_ids and len(message.album_message_ids) > 1:
                                 # ALBUM: Download ALL media files
                                 logger.info(
-                                    f"Archiving album with {len(message.album_message_ids)} media files"
+                                    "Archiving album with %d media files", len(message.album_message_ids)
                                 )
 
                                 media_file_ids = await self.media_archiver.archive_album(
@@ -266,7 +267,7 @@ class MessageProcessor:
                                 )
 
                                 if media_file_ids:
-                                    logger.info(f"Archived album: {len(media_file_ids)} files")
+                                    logger.info("Archived album: %d files", len(media_file_ids))
                             else:
                                 # SINGLE MESSAGE: Download one media file
                                 telegram_messages = await self.telegram_client.get_messages(
@@ -284,7 +285,7 @@ class MessageProcessor:
 
                                     if media_file_id:
                                         media_file_ids = [media_file_id]
-                                        logger.info(f"Archived media (file_id={media_file_id})")
+                                        logger.info("Archived media (file_id=%s)", media_file_id)
 
                         except Exception as e:
                             logger.error(f"Failed to archive media: {e}")
@@ -332,8 +333,8 @@ class MessageProcessor:
                 )
 
                 logger.info(
-                    f"Message archived: message_id={message.message_id}, "
-                    f"has_media={bool(media_file_ids)}"
+                    "Message archived: message_id=%s, has_media=%s",
+                    message.message_id, bool(media_file_ids),
                 )
 
                 return True
@@ -520,7 +521,7 @@ class MessageProcessor:
                     return
             else:
                 db_message.id = inserted_id
-                logger.debug(f"Message inserted: id={inserted_id}")
+                logger.debug("Message inserted: id=%s", inserted_id)
 
             # Create message_media links (with position for album ordering)
             if media_file_ids:
@@ -539,7 +540,7 @@ class MessageProcessor:
                     )
                     await session.execute(media_insert_stmt)
 
-                logger.debug(f"Created {len(media_file_ids)} message_media link(s)")
+                logger.debug("Created %d message_media link(s)", len(media_file_ids))
 
             await session.commit()
 
@@ -652,9 +653,9 @@ class MessageProcessor:
             await session.commit()
 
             logger.debug(
-                f"Tracked forward: local_msg={db_message_id} <- "
-                f"original={message.forward_from_channel_id}/{message.forward_from_message_id} "
-                f"(propagation={propagation_seconds}s)"
+                "Tracked forward: local_msg=%s <- original=%s/%s (propagation=%ss)",
+                db_message_id, message.forward_from_channel_id,
+                message.forward_from_message_id, propagation_seconds,
             )
 
         except Exception as e:
@@ -518,7 +518,7 @@ class RedisConsumer:
 
             self.messages_acknowledged += 1
 
-            logger.debug(f"Acknowledged message: {stream_id}")
+            logger.debug("Acknowledged message: %s", stream_id)
 
         except RedisError as e:
             logger.error(f"Failed to acknowledge message {stream_id}: {e}")
@@ -178,7 +178,7 @@ class MediaArchiver:
         try:
             await self.redis.lpush(MEDIA_SYNC_QUEUE, json.dumps(job))
             self.files_queued_for_sync += 1
-            logger.debug(f"Queued sync job for {sha256[:16]}... to {storage_box_id}")
+            logger.debug("Queued sync job for %.16s... to %s", sha256, storage_box_id)
         except Exception as e:
             logger.error(f"Failed to queue sync job: {e}")
             # Don't raise - file is still in local buffer and accessible
@@ -250,9 +250,8 @@ class MediaArchiver:
                 ).inc(existing_file.file_size)
 
                 logger.info(
-                    f"Media deduplicated: {sha256[:16]}... "
-                    f"(references: {existing_file.reference_count}, "
-                    f"saved {existing_file.file_size} bytes)"
+                    "Media deduplicated: %.16s... (references: %s, saved %s bytes)",
+                    sha256, existing_file.reference_count, existing_file.file_size,
                 )
 
             else:
@@ -273,7 +272,7 @@ class MediaArchiver:
                 shutil.move(str(temp_path), str(local_buffer_path))
                 temp_path = None  # Mark as moved (don't delete later)
 
-                logger.info(f"Media written to local buffer: {local_buffer_path}")
+                logger.info("Media written to local buffer: %s", local_buffer_path)
 
                 # Create MediaFile record with local_path (synced_at=NULL means pending sync)
                 media_file = MediaFile(
@@ -299,7 +298,7 @@ class MediaArchiver:
                 if self.minio:
                     try:
                         await self._upload_to_minio(local_buffer_path, s3_key, mime_type)
-                        logger.info(f"Uploaded to MinIO: {s3_key}")
+                        logger.info("Uploaded to MinIO: %s", s3_key)
                     except Exception as e:
                         logger.error(f"MinIO upload failed: {e}", exc_info=True)
                         # Queue sync job as fallback
@@ -322,8 +321,8 @@ class MediaArchiver:
                 ).inc(file_size)
 
                 logger.info(
-                    f"Media archived to local buffer: {sha256[:16]}... "
-                    f"({file_size} bytes, {mime_type}, box={selected_box_id})"
+                    "Media archived to local buffer: %.16s... (%s bytes, %s, box=%s)",
+                    sha256, file_size, mime_type, selected_box_id,
                 )
 
             # Return media_file_id so caller can create MessageMedia relationship
@@ -372,7 +371,7 @@ class MediaArchiver:
         media_file_ids = []
 
         logger.info(
-            f"Archiving album with {len(message_ids)} media files from channel {channel_id}"
+            "Archiving album with %d media files from channel %s", len(message_ids), channel_id
         )
 
         for msg_id in message_ids:
@@ -400,7 +399,7 @@ class MediaArchiver:
                 if media_file_id:
                     media_file_ids.append(media_file_id)
                     logger.debug(
-                        f"Archived media from message {msg_id}: media_file_id={media_file_id}"
+                        "Archived media from message %s: media_file_id=%s", msg_id, media_file_id
                     )
 
             except Exception as e:
@@ -411,7 +410,7 @@ class MediaArchiver:
                 continue
 
         logger.info(
-            f"Album archived: {len(media_file_ids)}/{len(message_ids)} media files successful"
+            "Album archived: %d/%d media files successful", len(media_file_ids), len(message_ids)
         )
 
         return media_file_ids
@@ -469,9 +468,8 @@ class MediaArchiver:
                 ).inc(existing_file.file_size)
 
                 logger.info(
-                    f"Media deduplicated: {sha256[:16]}... "
-                    f"(references: {existing_file.reference_count}, "
-                    f"saved {existing_file.file_size} bytes)"
+                    "Media deduplicated: %.16s... (references: %s, saved %s bytes)",
+                    sha256, existing_file.reference_count, existing_file.file_size,
                 )
 
             else:
@@ -515,7 +513,7 @@ class MediaArchiver:
                 if self.minio:
                     try:
                         await self._upload_to_minio(local_buffer_path, s3_key, mime_type)
-                        logger.info(f"Uploaded to MinIO: {s3_key}")
+                        logger.info("Uploaded to MinIO: %s", s3_key)
                     except Exception as e:
                         logger.error(f"MinIO upload failed: {e}", exc_info=True)
                         await self._queue_sync_job(
@@ -536,8 +534,8 @@ class MediaArchiver:
                 ).inc(file_size)
 
                 logger.info(
-                    f"Media archived to local buffer: {sha256[:16]}... "
-                    f"({file_size} bytes, {mime_type}, box={selected_box_id})"
+                    "Media archived to local buffer: %.16s... (%s bytes, %s, box=%s)",
+                    sha256, file_size, mime_type, selected_box_id,
                 )
 
             # Clean up temp file (if not moved to buffer)
@@ -581,7 +579,10 @@ class MediaArchiver:
                 webpage = message.media.webpage
                 if hasattr(webpage, 'photo') and webpage.photo:
                     # Download the webpage's OpenGraph thumbnail
-                    logger.debug(f"Downloading webpage thumbnail for {getattr(webpage, 'url', 'unknown URL')}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Downloading webpage thumbnail for %s", getattr(webpage, 'url', 'unknown URL')
+                        )
                     file_path = await client.download_media(webpage.photo, file=str(LOCAL_BUFFER_TMP))
                     if file_path:
                         path = Path(file_path)
@@ -590,7 +591,7 @@ class MediaArchiver:
                             media_type="webpage_thumb"
                         ).observe(download_duration)
                         self.files_downloaded += 1
-                        logger.info(f"Downloaded webpage thumbnail: {path.name}")
+                        logger.info("Downloaded webpage thumbnail: %s", path.name)
                         return path
                 # No downloadable thumbnail in webpage
                 logger.debug("Webpage has no downloadable photo thumbnail")
@@ -703,7 +704,7 @@ class MediaArchiver:
             video_path.unlink(missing_ok=True)
             output_path.rename(video_path)
 
-            logger.info(f"Video processed for streaming: {video_path.name}")
+            logger.info("Video processed for streaming: %s", video_path.name)
             return video_path
 
         except asyncio.TimeoutError:
@@ -785,7 +786,7 @@ class MediaArchiver:
                 content_type=mime_type,
             )
 
-            logger.debug(f"Uploaded to MinIO: {s3_key} ({mime_type})")
+            logger.debug("Uploaded to MinIO: %s (%s)", s3_key, mime_type)
 
         except S3Error as e:
             logger.error(f"Failed to upload to MinIO: {e}")
@@ -14,7 +14,7 @@ Usage:
     logger.info("Processing message", extra={"message_id": 123, "channel": "example_channel"})
 
 Output format:
-    {"timestamp": "2025-12-01T00:45:00.123Z", "level": "INFO", "service": "processor",
+    {"service": "processor", "timestamp": "2025-12-01T00:45:00.123Z", "level": "INFO",
      "logger": "message_processor", "message": "Processing message",
      "message_id": 123, "channel": "example_channel", "trace_id": "abc123"}
 """
@@ -22,28 +22,76 @@ Output format:
 import logging
 import os
 import sys
-from datetime import datetime, timezone
+from contextvars import ContextVar
+from datetime import date, datetime, time, timezone
+from enum import Enum
 from typing import Optional
 import json
 
-# Thread-local storage for trace_id context
-import threading
-_context = threading.local()
+import orjson
+
+# orjson options for log records: UTC timestamps with a "Z" suffix, and
+# tolerate non-string dict keys in extra fields like the stdlib encoder did.
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Internal LogRecord attributes that are not user-supplied extra fields
+_SKIP_FIELDS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'thread', 'threadName', 'processName', 'process', 'exc_info',
+    'exc_text', 'stack_info', 'message', 'msecs', 'relativeCreated',
+    'taskName'
+})
+
+_ERROR = logging.ERROR
+
+
+def _fallback_default(value):
+    """json.dumps default= for the stdlib fallback, matching orjson's output."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat().replace("+00:00", "Z")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+# LOG_LEVEL names accepted by setup_logging
+_LEVELS = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+}
+
+# Third-party loggers downgraded to WARNING once per process
+_NOISY_LOGGERS = ("urllib3", "httpx", "telethon", "asyncio")
+_noisy_loggers_quieted = False
+
+# Context-local trace_id: follows the current asyncio task (and thread)
+_trace_id: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
 
 
 def get_trace_id() -> Optional[str]:
     """Get the current trace ID from context."""
-    return getattr(_context, 'trace_id', None)
+    return _trace_id.get()
 
 
 def set_trace_id(trace_id: str) -> None:
     """Set the trace ID in context."""
-    _context.trace_id = trace_id
+    _trace_id.set(trace_id)
 
 
 def clear_trace_id() -> None:
     """Clear the trace ID from context."""
-    _context.trace_id = None
+    _trace_id.set(None)
 
 
 class JSONFormatter(logging.Formatter):
@@ -56,14 +104,22 @@ class JSONFormatter(logging.Formatter):
     def __init__(self, service_name: str = "unknown"):
         super().__init__()
         self.service_name = service_name
+        self._dumps = orjson.dumps
+        # Constant '{"service":"<name>",' fragment, encoded once and prepended
+        # to every record instead of re-serializing the service name
+        self._prefix = orjson.dumps({"service": service_name})[:-1] + b","
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
-        # Base log entry
+        return self.format_bytes(record).decode("utf-8")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format the log record as UTF-8 encoded JSON (used by BytesStreamHandler)."""
+        # Base log entry; record.created is captured once when the record is
+        # built, and orjson serializes the datetime natively
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
-            "service": self.service_name,
             "logger": record.name,
             "message": record.getMessage(),
         }
@@ -78,30 +134,69 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Add file/line info for errors
-        if record.levelno >= logging.ERROR:
+        if record.levelno >= _ERROR:
             log_entry["file"] = record.pathname
             log_entry["line"] = record.lineno
             log_entry["function"] = record.funcName
 
         # Add any extra fields passed via extra={}
-        # Skip internal logging fields
-        skip_fields = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-            'filename', 'module', 'lineno', 'funcName', 'created',
-            'thread', 'threadName', 'processName', 'process', 'exc_info',
-            'exc_text', 'stack_info', 'message', 'msecs', 'relativeCreated',
-            'taskName'
-        }
+        # Non-serializable values are coerced by default=str in the single dump below
+        skip_fields = _SKIP_FIELDS
         for key, value in record.__dict__.items():
             if key not in skip_fields and not key.startswith('_'):
-                # Handle non-serializable values
+                log_entry[key] = value
+
+        try:
+            body = self._dumps(log_entry, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, unsupported dict keys or circular
+            # references, which default= cannot intercept. Only this rare path
+            # probes each field and falls back to str() for the ones that fail.
+            # The record keeps the same shape as the orjson path (service
+            # first, compact separators, ISO timestamps with a "Z" suffix).
+            log_entry = {"service": self.service_name, **log_entry}
+            for key, value in log_entry.items():
                 try:
-                    json.dumps(value)  # Test if serializable
-                    log_entry[key] = value
+                    json.dumps(value, default=_fallback_default)
                 except (TypeError, ValueError):
                     log_entry[key] = str(value)
+            return json.dumps(
+                log_entry, ensure_ascii=False, separators=(",", ":"), default=_fallback_default
+            ).encode("utf-8")
+
+        if "service" in log_entry:
+            # An extra field overrides the service name; skip the prefix
+            return body
+        return self._prefix + body[1:]
+
 
-        return json.dumps(log_entry, ensure_ascii=False, default=str)
+class BytesStreamHandler(logging.StreamHandler):
+    """
+    Stream handler that writes JSONFormatter output straight to the binary stream.
+
+    orjson already produces UTF-8 bytes, so writing them to stream.buffer avoids
+    decoding to str only for the text layer to encode it again. Falls back to
+    the regular text path for other formatters or streams without a buffer.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        formatter = self.formatter
+        stream = self.stream
+        # Looked up per record so setStream() takes effect
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None or not isinstance(formatter, JSONFormatter):
+            super().emit(record)
+            return
+        try:
+            data = formatter.format_bytes(record) + b"\n"
+            # Push out pending text first so records keep their order
+            stream.flush()
+            buffer.write(data)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -127,41 +222,39 @@ class ConsoleFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record for console output."""
-        # Extract extra fields
-        skip_fields = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-            'filename', 'module', 'lineno', 'funcName', 'created',
-            'thread', 'threadName', 'processName', 'process', 'exc_info',
-            'exc_text', 'stack_info', 'message', 'msecs', 'relativeCreated',
-            'taskName'
-        }
-        extra = {k: v for k, v in record.__dict__.items()
-                 if k not in skip_fields and not k.startswith('_')}
+        # Extract extra fields; the set difference runs in C and is empty for
+        # the common record without extra={}, skipping the comprehension
+        record_dict = record.__dict__
+        extra = None
+        if record_dict.keys() - _SKIP_FIELDS:
+            skip_fields = _SKIP_FIELDS
+            extra = {k: v for k, v in record_dict.items()
+                     if k not in skip_fields and not k.startswith('_')}
 
         # Build message
         level = record.levelname
         if self.use_colors:
-            color = self.COLORS.get(level, '')
-            level = f"{color}{level}{self.RESET}"
+            level = "%s%s%s" % (self.COLORS.get(level, ''), level, self.RESET)
 
         # Short logger name (last component)
-        logger_name = record.name.split('.')[-1]
+        logger_name = record.name.rpartition('.')[2]
 
         # Format extra fields
         extra_str = ""
         if extra:
-            extra_items = [f"{k}={v}" for k, v in extra.items()]
-            extra_str = f" {{{', '.join(extra_items)}}}"
+            extra_str = " {%s}" % ", ".join(["%s=%s" % item for item in extra.items()])
 
         # Add trace_id if available
         trace_id = get_trace_id()
-        trace_str = f" [{trace_id[:8]}]" if trace_id else ""
+        trace_str = " [%s]" % trace_id[:8] if trace_id else ""
 
-        message = f"[{level}] {self.service_name}/{logger_name}:{trace_str} {record.getMessage()}{extra_str}"
+        message = "[%s] %s/%s:%s %s%s" % (
+            level, self.service_name, logger_name, trace_str, record.getMessage(), extra_str
+        )
 
         # Add exception info if present
         if record.exc_info:
-            message += f"\n{self.formatException(record.exc_info)}"
+            message += "\n" + self.formatException(record.exc_info)
 
         return message
 
@@ -191,7 +284,7 @@ def setup_logging(
     # Determine log level
     if level is None:
         level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    log_level = getattr(logging, level, logging.INFO)
+    log_level = _LEVELS.get(level, logging.INFO)
 
     # Determine format - default to JSON for Loki aggregation
     if json_format is None:
@@ -205,24 +298,24 @@ def setup_logging(
     # Remove existing handlers
     root_logger.handlers.clear()
 
-    # Create handler
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setLevel(log_level)
-
-    # Set formatter based on format choice
+    # Create handler and set formatter based on format choice
     if json_format:
+        handler = BytesStreamHandler(sys.stderr)
         formatter = JSONFormatter(service_name=service_name)
     else:
+        handler = logging.StreamHandler(sys.stderr)
         formatter = ConsoleFormatter(service_name=service_name)
+    handler.setLevel(log_level)
 
     handler.setFormatter(formatter)
     root_logger.addHandler(handler)
 
-    # Also configure specific loggers that might be noisy
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("telethon").setLevel(logging.WARNING)
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    # Also configure specific loggers that might be noisy (once per process)
+    global _noisy_loggers_quieted
+    if not _noisy_loggers_quieted:
+        for name in _NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+        _noisy_loggers_quieted = True
 
     # Log startup message
     logger = logging.getLogger(__name__)
@@ -261,18 +354,17 @@ class LogContext:
             logger.info("Processing")  # Will include trace_id in log
     """
 
+    __slots__ = ("trace_id", "_token")
+
     def __init__(self, trace_id: str):
         self.trace_id = trace_id
-        self.previous_trace_id = None
+        self._token = None
 
     def __enter__(self):
-        self.previous_trace_id = get_trace_id()
-        set_trace_id(self.trace_id)
+        self._token = _trace_id.set(self.trace_id)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.previous_trace_id:
-            set_trace_id(self.previous_trace_id)
-        else:
-            clear_trace_id()
+        _trace_id.reset(self._token)
+        self._token = None
         return False
@@ -12,7 +12,10 @@ All services import metrics from this module to ensure consistency.
 """
 
 import logging
-from typing import Optional
+import sys
+from functools import lru_cache
+from time import time as _wall_time
+from typing import Any, Dict, Optional, Tuple
 
 from prometheus_client import Counter, Gauge, Histogram, Info, start_http_server
 
@@ -45,10 +48,12 @@ api_service_info.info(
 # =============================================================================
 
 # Message pipeline counters
+# High-volume counters are not labelled by channel_id: every channel would
+# multiply their series count. Per-channel detail belongs in the logs.
 messages_processed_total = Counter(
     "tg_messages_processed_total",
     "Total messages processed through pipeline",
-    ["worker_id", "channel_id"],
+    ["worker_id"],
 )
 
 messages_archived_total = Counter(
@@ -78,7 +83,6 @@ processing_duration_seconds = Histogram(
 rule_evaluations_total = Counter(
     "tg_rule_evaluations_total",
     "Total rule-based evaluations",
-    ["channel_id"],
 )
 
 rule_matches_total = Counter(
@@ -179,7 +183,7 @@ topics_total = Counter(
 entities_extracted_total = Counter(
     "tg_entities_extracted_total",
     "Total entities extracted",
-    ["entity_type", "channel_id"],  # hashtags, mentions, urls, coordinates, custom
+    ["entity_type"],  # hashtags, mentions, urls, coordinates, custom
 )
 
 entity_extraction_duration_seconds = Histogram(
@@ -195,7 +199,7 @@ entity_extraction_duration_seconds = Histogram(
 media_archived_total = Counter(
     "tg_media_archived_total",
     "Total media files archived",
-    ["media_type", "channel_id"],  # photo, video, document, audio
+    ["media_type"],  # photo, video, document, audio
 )
 
 media_download_duration_seconds = Histogram(
@@ -386,14 +390,72 @@ pipeline_active = Gauge(
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Bound label children per metric, keyed by the label-value tuple. labels()
+# rebuilds and hashes its key under the metric lock on every call; these
+# caches turn the hot-path lookup into a single dict hit. They hold exactly
+# the children prometheus_client already keeps, so they add no cardinality.
+_messages_processed_children: Dict[Tuple[Any, ...], Counter] = {}
+_rule_matches_children: Dict[Tuple[Any, ...], Counter] = {}
+_llm_calls_skipped_children: Dict[Tuple[Any, ...], Counter] = {}
+_llm_requests_children: Dict[Tuple[Any, ...], Counter] = {}
+_llm_duration_children: Dict[Tuple[Any, ...], Histogram] = {}
+_llm_tokens_children: Dict[Tuple[Any, ...], Counter] = {}
+_topics_children: Dict[Tuple[Any, ...], Counter] = {}
+_entities_extracted_children: Dict[Tuple[Any, ...], Counter] = {}
+_media_archived_children: Dict[Tuple[Any, ...], Counter] = {}
+_media_storage_bytes_children: Dict[Tuple[Any, ...], Counter] = {}
+_media_dedup_saves_children: Dict[Tuple[Any, ...], Counter] = {}
+_media_failures_children: Dict[Tuple[Any, ...], Counter] = {}
+_api_requests_children: Dict[Tuple[Any, ...], Counter] = {}
+_api_duration_children: Dict[Tuple[Any, ...], Histogram] = {}
+_search_operations_children: Dict[Tuple[Any, ...], Counter] = {}
+_rss_generated_children: Dict[Tuple[Any, ...], Counter] = {}
+_rss_duration_children: Dict[Tuple[Any, ...], Histogram] = {}
+_queue_pending_children: Dict[Tuple[Any, ...], Gauge] = {}
+_classifier_mode_children: Dict[Tuple[Any, ...], Counter] = {}
+_classifier_fallback_children: Dict[Tuple[Any, ...], Counter] = {}
+_classifier_task_children: Dict[Tuple[Any, ...], Histogram] = {}
+
+
+# Children whose label values never vary, resolved once at import
+_PROCESSING_DURATION_TOTAL = processing_duration_seconds.labels(stage="total")
+
+
+# Processed-message counter per Redis stream name (see redis_consumer streams)
+_STREAM_COUNTERS: Dict[str, Counter] = {
+    "telegram:messages:realtime": processed_realtime_total,
+    "telegram:messages:backfill": processed_backfill_total,
+    "telegram:messages": processed_legacy_total,
+}
+
+
+@lru_cache(maxsize=10_000)
+def _label_str(value: Any) -> str:
+    """Return the interned label string for a non-str label value (channel ID, status code)."""
+    return sys.intern(str(value))
+
+
+def _child(cache: Dict[Tuple[Any, ...], Any], metric: Any, *labelvalues: Any) -> Any:
+    """
+    Return the labelled child of metric, resolving it once per label tuple.
+
+    Integer label values (channel IDs, status codes) are used in the cache key
+    as-is and converted to their label string only on a miss, so hits never
+    call str().
+    """
+    child = cache.get(labelvalues)
+    if child is None:
+        child = cache[labelvalues] = metric.labels(
+            *[v if v.__class__ is str else _label_str(v) for v in labelvalues]
+        )
+    return child
+
+
 
 def record_message_processed(worker_id: str, channel_id: int, duration_seconds: float) -> None:
-    """Record a processed message."""
-    messages_processed_total.labels(
-        worker_id=worker_id,
-        channel_id=str(channel_id),
-    ).inc()
-    processing_duration_seconds.labels(stage="total").observe(duration_seconds)
+    """Record a processed message (channel_id is not a label; kept for callers)."""
+    _child(_messages_processed_children, messages_processed_total, worker_id).inc()
+    _PROCESSING_DURATION_TOTAL.observe(duration_seconds)
 
 
 def record_rule_evaluation(
@@ -404,98 +466,74 @@ def record_rule_evaluation(
     skip_llm: bool = False,
 ) -> None:
     """Record rule engine evaluation."""
-    rule_evaluations_total.labels(channel_id=str(channel_id)).inc()
+    rule_evaluations_total.inc()
     rule_evaluation_duration_ms.observe(duration_ms)
 
     if matched and rule_name:
-        rule_matches_total.labels(
-            rule_name=rule_name,
-            channel_id=str(channel_id),
-        ).inc()
+        _child(_rule_matches_children, rule_matches_total, rule_name, channel_id).inc()
 
     if skip_llm:
-        llm_calls_skipped_total.labels(
-            channel_id=str(channel_id),
-            skip_reason="rule_matched",
-        ).inc()
+        _child(_llm_calls_skipped_children, llm_calls_skipped_total, channel_id, "rule_matched").inc()
 
 
 def record_llm_request(
     model: str, status: str, duration_seconds: float, tokens: int = 0
 ) -> None:
     """Record LLM scoring request."""
-    llm_requests_total.labels(model=model, status=status).inc()
-    llm_response_duration_seconds.labels(model=model).observe(duration_seconds)
+    _child(_llm_requests_children, llm_requests_total, model, status).inc()
+    _child(_llm_duration_children, llm_response_duration_seconds, model).observe(duration_seconds)
 
     if tokens > 0:
-        llm_tokens_total.labels(model=model, token_type="total").inc(tokens)
+        _child(_llm_tokens_children, llm_tokens_total, model, "total").inc(tokens)
 
 
 def record_topic(topic: str) -> None:
     """Record topic classification."""
-    topics_total.labels(topic=topic).inc()
+    _child(_topics_children, topics_total, topic).inc()
 
 
 def record_entity_extraction(
     entity_type: str, channel_id: int, count: int, duration_seconds: float
 ) -> None:
-    """Record entity extraction."""
-    entities_extracted_total.labels(
-        entity_type=entity_type,
-        channel_id=str(channel_id),
-    ).inc(count)
+    """Record entity extraction (channel_id is not a label; kept for callers)."""
+    _child(_entities_extracted_children, entities_extracted_total, entity_type).inc(count)
     entity_extraction_duration_seconds.observe(duration_seconds)
 
 
 def record_media_archived(
     media_type: str, channel_id: int, size_bytes: int, deduplicated: bool
 ) -> None:
-    """Record media archival."""
-    media_archived_total.labels(
-        media_type=media_type,
-        channel_id=str(channel_id),
-    ).inc()
-    media_storage_bytes_total.labels(media_type=media_type).inc(size_bytes)
+    """Record media archival (channel_id is not a label; kept for callers)."""
+    _child(_media_archived_children, media_archived_total, media_type).inc()
+    _child(_media_storage_bytes_children, media_storage_bytes_total, media_type).inc(size_bytes)
 
     if deduplicated:
-        media_deduplication_saves_total.labels(media_type=media_type).inc(size_bytes)
+        _child(_media_dedup_saves_children, media_deduplication_saves_total, media_type).inc(size_bytes)
 
 
 def record_media_archival_failure(channel_id: int, media_type: str) -> None:
     """Record a media archival failure (message has media_type but no files archived)."""
-    media_archival_failures_total.labels(
-        channel_id=str(channel_id),
-        media_type=media_type,
-    ).inc()
+    _child(_media_failures_children, media_archival_failures_total, channel_id, media_type).inc()
 
 
 def record_api_request(
     method: str, endpoint: str, status_code: int, duration_seconds: float
 ) -> None:
     """Record API request."""
-    api_requests_total.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=str(status_code),
-    ).inc()
-    api_request_duration_seconds.labels(
-        method=method,
-        endpoint=endpoint,
-    ).observe(duration_seconds)
+    _child(_api_requests_children, api_requests_total, method, endpoint, status_code).inc()
+    _child(_api_duration_children, api_request_duration_seconds, method, endpoint).observe(duration_seconds)
 
 
 def record_search_operation(search_type: str, result_count: int) -> None:
     """Record search operation."""
-    search_operations_total.labels(search_type=search_type).inc()
+    _child(_search_operations_children, search_operations_total, search_type).inc()
     search_results_count.observe(result_count)
 
 
 def record_rss_generation(feed_type: str, duration_seconds: float) -> None:
     """Record RSS feed generation."""
-    rss_feeds_generated_total.labels(feed_type=feed_type).inc()
-    rss_generation_duration_seconds.labels(feed_type=feed_type).observe(
-        duration_seconds
-    )
+    _child(_rss_generated_children, rss_feeds_generated_total, feed_type).inc()
+    _child(_rss_duration_children, rss_generation_duration_seconds, feed_type).observe(duration_seconds)
 
 
 def record_queue_depth(consumer_group: str, pending_count: int) -> None:
@@ -506,7 +544,7 @@ def record_queue_depth(consumer_group: str, pending_count: int) -> None:
         consumer_group: Name of the consumer group (e.g., 'processor-workers')
         pending_count: Number of messages pending in the queue
     """
-    queue_messages_pending.labels(consumer_group=consumer_group).set(pending_count)
+    _child(_queue_pending_children, queue_messages_pending, consumer_group).set(pending_count)
 
 
 def record_priority_queue_depths(
@@ -534,12 +572,17 @@ def record_message_processed_by_stream(stream_name: str) -> None:
     Args:
         stream_name: Redis stream name (realtime, backfill, or legacy)
     """
-    if "realtime" in stream_name:
-        processed_realtime_total.inc()
-    elif "backfill" in stream_name:
-        processed_backfill_total.inc()
-    else:
-        processed_legacy_total.inc()
+    counter = _STREAM_COUNTERS.get(stream_name)
+    if counter is None:
+        # Unknown stream name: classify by substring once and remember it
+        if "realtime" in stream_name:
+            counter = processed_realtime_total
+        elif "backfill" in stream_name:
+            counter = processed_backfill_total
+        else:
+            counter = processed_legacy_total
+        _STREAM_COUNTERS[stream_name] = counter
+    counter.inc()
 
 
 def record_message_archived_timestamp() -> None:
@@ -549,9 +592,7 @@ def record_message_archived_timestamp() -> None:
     Call this whenever a message is successfully archived to the database.
     Used by alerting rules to detect stale data (no new messages archived).
     """
-    import time
-
-    message_last_archived_timestamp.set(time.time())
+    message_last_archived_timestamp.set(_wall_time())
     pipeline_active.set(1)
 
 
@@ -564,7 +605,7 @@ def mark_pipeline_inactive() -> None:
 
 def record_classifier_mode(mode: str) -> None:
     """Record which classifier mode was used."""
-    classifier_mode_total.labels(mode=mode).inc()
+    _child(_classifier_mode_children, classifier_mode_total, mode).inc()
 
 
 def record_classifier_early_exit() -> None:
@@ -574,12 +615,12 @@ def record_classifier_early_exit() -> None:
 
 def record_classifier_fallback(failed_task: str) -> None:
     """Record fallback from modular to unified."""
-    classifier_fallback_total.labels(failed_task=failed_task).inc()
+    _child(_classifier_fallback_children, classifier_fallback_total, failed_task).inc()
 
 
 def record_classifier_task_duration(task: str, duration_seconds: float) -> None:
     """Record per-task duration in modular mode."""
-    classifier_task_duration_seconds.labels(task=task).observe(duration_seconds)
+    _child(_classifier_task_children, classifier_task_duration_seconds, task).observe(duration_seconds)
 
 
 class MetricsServer:
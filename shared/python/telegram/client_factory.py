@@ -56,7 +56,8 @@ async def create_telegram_client(
     connection_retries: int = 5,
     retry_delay: int = 1,
     auto_reconnect: bool = True,
-    phone: Optional[str] = None
+    phone: Optional[str] = None,
+    log_identity: bool = True
 ) -> TelegramClient:
     """
     Create and start a Telegram client with standardized configuration.
@@ -73,6 +74,8 @@ async def create_telegram_client(
         retry_delay: Delay between retries in seconds (default: 1)
         auto_reconnect: Whether to auto-reconnect on disconnection (default: True)
         phone: Phone number for authentication (required for first-time setup)
+        log_identity: Fetch and log the connected account via get_me() (default: True).
+            Pass False to skip the extra Telegram round-trip.
 
     Returns:
         Started TelegramClient instance ready for use.
@@ -110,11 +113,14 @@ async def create_telegram_client(
 
     await client.start(phone=phone)
 
-    # Log connection status
-    me = await client.get_me()
-    if me:
-        logger.info(f"Connected to Telegram as: {me.first_name} (@{me.username or 'no username'})")
+    # Log connection status (get_me() is an extra network round-trip)
+    if log_identity:
+        me = await client.get_me()
+        if me:
+            logger.info(f"Connected to Telegram as: {me.first_name} (@{me.username or 'no username'})")
+        else:
+            logger.warning("Connected to Telegram but unable to get user info")
     else:
-        logger.warning("Connected to Telegram but unable to get user info")
+        logger.info("Connected to Telegram")
 
     return client
@@ -15,7 +15,13 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Optional, Tuple
 
 try:
@@ -34,6 +40,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Inputs with no letters once URLs are removed (numbers, emoji, punctuation, links)
+# have nothing to translate
+URL_PATTERN = re.compile(r'https?://\S+')
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+# Max translations kept in the in-memory cache (repeated forwards/boilerplate)
+TRANSLATION_CACHE_SIZE = 10_000
+
+# Minimum spacing between Google Translate Free request starts (rate limiting)
+GOOGLE_MIN_INTERVAL_SECONDS = 0.5
+
+# Threads for blocking deep-translator calls (requests are rate limited, so few are needed)
+GOOGLE_EXECUTOR_WORKERS = 4
+
+# langdetect cost grows with input length; a prefix is enough to identify the language
+LANGDETECT_SAMPLE_CHARS = 500
+
+
+@lru_cache(maxsize=4096)
+def _detect_cached(sample: str) -> str:
+    """Run langdetect on a text sample (deterministic with DetectorFactory.seed = 0)."""
+    return detect(sample)
+
 
 class CommentTranslator:
     """
@@ -60,6 +89,19 @@ class CommentTranslator:
         self.target_language = target_language
         self.deepl_api_key = deepl_api_key
 
+        # Dedicated pool so slow Google calls don't tie up the loop's default executor
+        self._google_executor = ThreadPoolExecutor(
+            max_workers=GOOGLE_EXECUTOR_WORKERS,
+            thread_name_prefix="gtrans",
+        )
+
+        # Spaces out Google requests; only waits when calls arrive faster than the limit
+        self._google_lock = asyncio.Lock()
+        self._google_next_at = 0.0
+
+        # LRU cache of successful translations: key -> (translated_text, method, confidence)
+        self._cache: "OrderedDict[Tuple[Optional[str], bytes], Tuple[str, str, float]]" = OrderedDict()
+
         # Initialize Google Translator (free)
         if GoogleTranslator:
             try:
@@ -98,7 +140,7 @@ class CommentTranslator:
             return "unknown", 0.0
 
         try:
-            lang = detect(text)
+            lang = _detect_cached(text[:LANGDETECT_SAMPLE_CHARS])
             # langdetect doesn't provide confidence, estimate based on text length
             # Longer text = higher confidence in detection
             confidence = min(1.0, len(text) / 100)
@@ -128,16 +170,21 @@ class CommentTranslator:
             return None
 
         try:
+            # Avoid rate limiting: wait only if the previous request started too recently
+            async with self._google_lock:
+                delay = self._google_next_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._google_next_at = time.monotonic() + GOOGLE_MIN_INTERVAL_SECONDS
+
             # Run in executor to avoid blocking (deep-translator is synchronous)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             translated = await loop.run_in_executor(
-                None,
-                lambda: self.google_translator.translate(text)
+                self._google_executor,
+                self.google_translator.translate,
+                text
             )
 
-            # Add small delay to avoid rate limiting
-            await asyncio.sleep(0.5)
-
             return translated
 
         except Exception as e:
@@ -165,10 +212,16 @@ class CommentTranslator:
             return None
 
         try:
-            result = self.deepl_translator.translate_text(
-                text,
-                source_lang=source_lang.upper() if source_lang else None,
-                target_lang=self.target_language.upper()
+            # Run in executor to avoid blocking (the deepl SDK is synchronous)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None,
+                partial(
+                    self.deepl_translator.translate_text,
+                    text,
+                    source_lang=source_lang.upper() if source_lang else None,
+                    target_lang=self.target_language.upper()
+                )
             )
             return result.text
 
@@ -203,6 +256,17 @@ class CommentTranslator:
         if not text or len(text.strip()) == 0:
             return None, "none", 0.0
 
+        # Skip URL/number/emoji-only text without detection or an API call
+        if not LETTER_PATTERN.search(URL_PATTERN.sub("", text)):
+            return None, "none", 0.0
+
+        # Repeated text (forwards, channel footers) skips detection and the API call
+        cache_key = (source_lang, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
         # Detect language if not provided
         if not source_lang:
             source_lang, lang_confidence = self.detect_language(text)
@@ -212,7 +276,7 @@ class CommentTranslator:
         # Skip if already in target language
         if source_lang == self.target_language:
             logger.debug(f"Text already in {self.target_language}, skipping translation")
-            return text, "none", 1.0
+            return self._cache_result(cache_key, (text, "none", 1.0))
 
         # Skip if language unknown
         if source_lang == "unknown":
@@ -223,19 +287,30 @@ class CommentTranslator:
         translated = await self.translate_google_free(text, source_lang)
         if translated:
             logger.info(f"Translated via Google Free: {source_lang} → {self.target_language}")
-            return translated, "google_free", lang_confidence
+            return self._cache_result(cache_key, (translated, "google_free", lang_confidence))
 
         # Try DeepL Free (secondary)
         if self.deepl_translator:
             translated = await self.translate_deepl_free(text, source_lang)
             if translated:
                 logger.info(f"Translated via DeepL Free: {source_lang} → {self.target_language}")
-                return translated, "deepl_free", lang_confidence
+                return self._cache_result(cache_key, (translated, "deepl_free", lang_confidence))
 
         # No translation available
         logger.warning(f"Could not translate text from {source_lang}")
         return None, "none", lang_confidence
 
+    def _cache_result(
+        self,
+        key: Tuple[Optional[str], bytes],
+        result: Tuple[str, str, float]
+    ) -> Tuple[str, str, float]:
+        """Store a successful translation, evicting the least recently used entry."""
+        self._cache[key] = result
+        if len(self._cache) > TRANSLATION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
 
 # Singleton instance
 _translator_instance: Optional[CommentTranslator] = None